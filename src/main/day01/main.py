@@ -2,6 +2,118 @@
 https://adventofcode.com/2021/day/1
 """
 
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import islice, repeat
+from operator import lt
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+
+
+class ChunkSummary(NamedTuple):
+    """Summary of a contiguous chunk of measurements.
+
+    Besides the counts inside the chunk, the first and last three measurements
+    are kept so that neighbouring chunks can be stitched together.
+    """
+    increases: int
+    window_increases: int
+    head: tuple[int, ...]
+    tail: tuple[int, ...]
+
+    def merge(self, other: "ChunkSummary") -> "ChunkSummary":
+        """Merge with the summary of the chunk directly following this one.
+
+        :param other: Summary of the following chunk
+        :return: Summary of both chunks
+        """
+        boundary = self.tail + other.head
+        offset = len(self.tail)
+        increases = sum(
+            boundary[i] < boundary[i + 1] for i in
+            range(max(offset - 1, 0), min(offset, len(boundary) - 1)))
+        window_increases = sum(
+            boundary[i] < boundary[i + 3] for i in
+            range(max(offset - 3, 0), min(offset, len(boundary) - 3)))
+        return ChunkSummary(
+            self.increases + other.increases + increases,
+            self.window_increases + other.window_increases + window_increases,
+            (self.head + other.head)[:3],
+            (self.tail + other.tail)[-3:])
+
+
+class SonarSweepCounter:
+    """Incremental counter for both parts.
+
+    Every new measurement updates both counts in constant time. Keeping an
+    open file and calling follow with it again later only reads the lines
+    appended in the meantime. A line which is still being written is kept
+    by follow until its newline arrives, and flush takes it if it never
+    does.
+    """
+
+    def __init__(self) -> None:
+        self.increases: int = 0
+        self.window_increases: int = 0
+        self._window: deque[int] = deque(maxlen=3)
+        self._incomplete_line: str = ""
+
+    @property
+    def last_measurements(self) -> tuple[int, ...]:
+        """Get the last three measurements."""
+        return tuple(self._window)
+
+    def add(self, measurement: Union[int, str]) -> None:
+        """Add a new measurement.
+
+        :param measurement: Measurement of the sea floor depth or line
+                            containing it
+        """
+        if self._incomplete_line:
+            raise ValueError("Incomplete line pending, call flush first")
+        self._add_measurement(int(measurement))
+
+    def extend(self, measurements: Iterable[Union[int, str]]) -> None:
+        """Add several new measurements.
+
+        :param measurements: Measurements of the sea floor depths or lines
+                             containing them
+        """
+        for measurement in measurements:
+            self.add(measurement)
+
+    def follow(self, lines: Iterable[str]) -> None:
+        """Add the measurements of lines read from a growing file.
+
+        A last line without a newline is kept and joined to the text read by
+        the next call, as the rest of it may not have been written yet.
+
+        :param lines: Lines read from a file
+        """
+        for line in lines:
+            line = self._incomplete_line + line
+            if not line.endswith("\n"):
+                self._incomplete_line = line
+                continue
+            self._incomplete_line = ""
+            if line.strip():
+                self._add_measurement(int(line))
+
+    def flush(self) -> None:
+        """Take a last line kept by follow which has no newline."""
+        line, self._incomplete_line = self._incomplete_line, ""
+        if line.strip():
+            self._add_measurement(int(line))
+
+    def _add_measurement(self, measurement: int) -> None:
+        if self._window:
+            self.increases += self._window[-1] < measurement
+        if len(self._window) == self._window.maxlen:
+            self.window_increases += self._window[0] < measurement
+        self._window.append(measurement)
+
 
 def data_input(filename: str = "data") -> list[int]:
     """Reading measurements of sea floor depths.
@@ -13,6 +125,89 @@ def data_input(filename: str = "data") -> list[int]:
         return [int(line) for line in file.read().splitlines()]
 
 
+def data_stream(filename: str = "data") -> Iterator[int]:
+    """Lazily reading measurements of sea floor depths line by line.
+
+    :param filename: Filename
+    :return: Iterator over the measurements of sea floor depths
+    """
+    with open(filename) as file:
+        for line in file:
+            yield int(line)
+
+
+def sonar_sweep(measurements: Iterable[Union[int, str]]) -> tuple[int, int]:
+    """Both parts in a single pass over the measurements.
+
+    Only the last three measurements are kept, so the measurements can be
+    given as a lazy iterable or as an open file.
+
+    :param measurements: Measurements of the sea floor depths or lines
+                         containing them
+    :return: Number of times a depth measurement increases and number of times
+             a three-measurement sliding window increased
+    """
+    counter = SonarSweepCounter()
+    counter.extend(measurements)
+    return counter.increases, counter.window_increases
+
+
+def parallel_sonar_sweep(filename: str = "data",
+                         processes: Optional[int] = None) -> tuple[int, int]:
+    """Both parts computed in parallel over a memory-mapped file.
+
+    The file is split into byte ranges on newline boundaries, every range is
+    summarized in a worker process and the summaries are merged in order.
+    There are more ranges than processes so that the processes stay busy when
+    ranges take different times.
+
+    :param filename: Filename
+    :param processes: Number of worker processes, defaults to the CPU count
+    :return: Number of times a depth measurement increases and number of times
+             a three-measurement sliding window increased
+    """
+    processes = processes or os.cpu_count() or 1
+    amount_of_ranges = 4 * processes
+    with open(filename, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0, 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            boundaries = [0]
+            for i in range(1, amount_of_ranges):
+                newline = mapped.find(b"\n", max(size * i // amount_of_ranges,
+                                                 boundaries[-1]))
+                if newline == -1:
+                    break
+                boundaries.append(newline + 1)
+            boundaries.append(size)
+    ranges = [(start, end) for start, end in zip(boundaries, boundaries[1:])
+              if start < end]
+    with ProcessPoolExecutor(
+            max_workers=min(processes, len(ranges))) as executor:
+        summaries = executor.map(_summarize_chunk, repeat(filename),
+                                 *zip(*ranges))
+        summary = reduce(ChunkSummary.merge, summaries)
+    return summary.increases, summary.window_increases
+
+
+def count_window_increases(measurements: Sequence[int], k: int) -> int:
+    """Number of times a k-measurement sliding window increased.
+
+    Two neighbouring windows share k - 1 measurements, so the sum of the later
+    window is larger exactly if measurements[i + k] > measurements[i]. Hence
+    no window sums have to be built and no copies of the measurements are
+    made.
+
+    :param measurements: Measurements of the sea floor depths
+    :param k: Size of the sliding window
+    :return: Number of times a k-measurement sliding window increased
+    """
+    if k < 1:
+        raise ValueError(f"Window size must be positive, got {k}")
+    return sum(map(lt, measurements, islice(measurements, k, None)))
+
+
 def part_1(measurements: list[int]) -> int:
     """Part 1.
 
@@ -20,9 +215,7 @@ def part_1(measurements: list[int]) -> int:
     :return: Number of times a depth measurement increases from the previous
              measurement
     """
-    return sum(
-        measurement_1 < measurement_2 for measurement_1, measurement_2 in
-        zip(measurements, measurements[1:]))
+    return count_window_increases(measurements, 1)
 
 
 def part_2(measurements: list[int]) -> int:
@@ -31,11 +224,7 @@ def part_2(measurements: list[int]) -> int:
     :param measurements: List of measurements of the sea floor depths
     :return: Number of times a three-measurement sliding window increased
     """
-    three_measurement_sliding_window = [
-        sum(three_measurement_sliding_window) for
-        three_measurement_sliding_window in
-        zip(measurements, measurements[1:], measurements[2:])]
-    return part_1(three_measurement_sliding_window)
+    return count_window_increases(measurements, 3)
 
 
 def main() -> None:
@@ -45,5 +234,37 @@ def main() -> None:
     print(part_2(measurements))
 
 
+def _summarize_chunk(filename: str, start: int, end: int) -> ChunkSummary:
+    """Summarize the measurements in a byte range of a file.
+
+    The range is scanned line by line, so only the first three measurements
+    and the state of a SonarSweepCounter are kept in memory.
+
+    :param filename: Filename
+    :param start: First byte of the range
+    :param end: Byte after the last byte of the range
+    :return: Summary of the measurements in the range
+    """
+    counter = SonarSweepCounter()
+    head: list[int] = []
+    with open(filename, "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        position = start
+        while position < end:
+            newline = mapped.find(b"\n", position, end)
+            if newline == -1:
+                newline = end
+            line = mapped[position:newline]
+            position = newline + 1
+            if not line.strip():
+                continue
+            measurement = int(line)
+            if len(head) < 3:
+                head.append(measurement)
+            counter.add(measurement)
+    return ChunkSummary(counter.increases, counter.window_increases,
+                        tuple(head), counter.last_measurements)
+
+
 if __name__ == "__main__":
     main()
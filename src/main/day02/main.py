@@ -2,69 +2,164 @@
 https://adventofcode.com/2021/day/2
 """
 
-from typing import NamedTuple
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate
+from operator import mul, not_
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 
-class Command(NamedTuple):
-    """Command."""
-    movement: str
-    amount: int
+class Commands(NamedTuple):
+    """Commands stored column-wise.
 
+    The opcode of a command is the sign by which it changes the depth in part 1
+    and the aim in part 2, so forward commands have the opcode 0.
+    """
+    opcodes: array
+    amounts: array
+
+
+MOVEMENT_TO_OPCODE: dict[str, int] = {"forward": 0,
+                                      "down": 1,
+                                      "up": -1}
+
+
+class Transform(NamedTuple):
+    """Affine update of position and aim caused by a sequence of commands.
+
+    Starting with aim a, the sequence moves horizontal forward and depth
+    depth + a * horizontal down and changes the aim by aim.
+    """
+    horizontal: int = 0
+    depth: int = 0
+    aim: int = 0
 
-def data_input(filename: str = "data") -> list[Command]:
+    def compose(self, other: "Transform") -> "Transform":
+        """Transform of this sequence of commands followed by another one.
+
+        :param other: Transform of the following sequence of commands
+        :return: Transform of both sequences
+        """
+        return Transform(
+            self.horizontal + other.horizontal,
+            self.depth + other.depth + self.aim * other.horizontal,
+            self.aim + other.aim)
+
+
+def data_input(filename: str = "data") -> Commands:
     """Reading commands from data.
 
     :param filename: Filename
-    :return: List of commands
+    :return: Commands
+    """
+    opcodes = array("b")
+    amounts = array("i")
+    with open(filename) as file:
+        for line in file:
+            movement, amount = line.split()
+            opcodes.append(MOVEMENT_TO_OPCODE[movement])
+            amounts.append(int(amount))
+    return Commands(opcodes, amounts)
+
+
+def data_stream(filename: str = "data") -> Iterator[tuple[int, int]]:
+    """Lazily reading commands from data line by line.
+
+    :param filename: Filename
+    :return: Iterator over the opcodes and amounts of the commands
     """
     with open(filename) as file:
-        return [Command(line.split(" ")[0], int(line.split(" ")[1])) for line
-                in file.read().splitlines()]
+        for line in file:
+            movement, amount = line.split()
+            yield MOVEMENT_TO_OPCODE[movement], int(amount)
+
+
+def evaluate_commands(commands: Iterable[tuple[int, int]]) -> tuple[int, int]:
+    """Both parts in a single pass over the commands.
+
+    The final depth of part 1 is the final aim of part 2.
+
+    :param commands: Opcodes and amounts of the commands
+    :return: Products of final horizontal position and final depth for part 1
+             and part 2
+    """
+    horizontal = depth = aim = 0
+    for opcode, amount in commands:
+        if opcode:
+            aim += opcode * amount
+        else:
+            horizontal += amount
+            depth += aim * amount
+    return horizontal * aim, horizontal * depth
 
 
-def part_1(commands: list[Command]) -> int:
+def part_1(commands: Commands) -> int:
     """Part 1.
 
-    :param commands: List of commands
+    :param commands: Commands
     :return: Product of final horizontal position and final depth
     """
-    commands_dict: dict[str, complex] = {"forward": 1,
-                                         "down": 1j,
-                                         "up": -1j}
-    position: complex = sum(
-        commands_dict[command.movement] * command.amount for command in
-        commands)
+    horizontal = sum(map(mul, commands.amounts, map(not_, commands.opcodes)))
+    depth = sum(map(mul, commands.opcodes, commands.amounts))
+    return horizontal * depth
 
-    return int(position.real * position.imag)
 
+def reduce_commands(commands: Commands) -> Transform:
+    """Reduce commands to a single transform.
 
-def part_2(commands: list[Command]) -> int:
+    The aim before every command is the cumulative sum of the aim changes and
+    only forward commands, whose aim change is 0, move the submarine.
+
+    :param commands: Commands
+    :return: Transform of all commands
+    """
+    aims = accumulate(map(mul, commands.opcodes, commands.amounts))
+    horizontal = sum(map(mul, commands.amounts, map(not_, commands.opcodes)))
+    depth = sum(map(mul, map(mul, commands.amounts,
+                             map(not_, commands.opcodes)), aims))
+    aim = sum(map(mul, commands.opcodes, commands.amounts))
+    return Transform(horizontal, depth, aim)
+
+
+def part_2(commands: Commands) -> int:
     """Part 2.
 
-    :param commands: List commands
+    :param commands: Commands
     :return: Product of final horizontal position and final depth
     """
-    commands_dict: dict[str, int] = {"forward": 1,
-                                     "down": 1,
-                                     "up": -1}
+    transform = reduce_commands(commands)
+    return transform.horizontal * transform.depth
 
-    position: complex = 0
-    aim = 0
 
-    for command in commands:
-        if command.movement in ["down", "up"]:
-            aim += commands_dict[command.movement] * command.amount
-        if command.movement == "forward":
-            position += command.amount * complex(1, aim)
+def parallel_part_2(commands: Commands,
+                    processes: Optional[int] = None) -> int:
+    """Part 2 computed in parallel.
 
-    return int(position.real * position.imag)
+    The commands are split into chunks which are reduced to transforms in
+    worker processes. The transforms are then composed in order.
+
+    :param commands: Commands
+    :param processes: Number of worker processes, defaults to the CPU count
+    :return: Product of final horizontal position and final depth
+    """
+    processes = processes or os.cpu_count() or 1
+    amount_of_commands = len(commands.opcodes)
+    chunk_size = -(-amount_of_commands // processes) or 1
+    chunks = [Commands(commands.opcodes[i:i + chunk_size],
+                       commands.amounts[i:i + chunk_size]) for i in
+              range(0, amount_of_commands, chunk_size)]
+    with ProcessPoolExecutor(max_workers=max(len(chunks), 1)) as executor:
+        transform = reduce(Transform.compose,
+                           executor.map(reduce_commands, chunks), Transform())
+    return transform.horizontal * transform.depth
 
 
 def main() -> None:
     """Main function."""
-    commands = data_input()
-    print(part_1(commands))
-    print(part_2(commands))
+    for result in evaluate_commands(data_stream()):
+        print(result)
 
 
 if __name__ == "__main__":
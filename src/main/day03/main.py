@@ -2,101 +2,198 @@
 https://adventofcode.com/2021/day/3
 """
 
-from collections import Counter
-from typing import NewType
+import mmap
+from bisect import bisect_left
+from typing import NamedTuple
 
-BinaryNumber = NewType("BinaryNumber", str)
 
+class DiagnosticReport(NamedTuple):
+    """Diagnostic report with the binary numbers parsed to integers.
 
-def data_input(filename: str = "data") -> list[BinaryNumber]:
+    The numbers are sorted, so all numbers starting with the same bits form a
+    contiguous range which is narrowed by bisection when determining the
+    ratings. The number of ones per column, starting with the most significant
+    bit, is counted once while reading the report.
+    """
+    numbers: list[int]
+    width: int
+    ones_per_column: list[int]
+
+    @property
+    def mask(self) -> int:
+        """Integer with all bits of the binary numbers set."""
+        return (1 << self.width) - 1
+
+
+class PackedDiagnosticReport(NamedTuple):
+    """Diagnostic report stored as packed bit columns.
+
+    Every column is an integer whose bits are the bits of that column for all
+    rows, the first row being the most significant bit. Sets of rows are
+    integers of the same shape, so counting bits in a column for a set of rows
+    is a bitwise and followed by a popcount.
+    """
+    columns: list[int]
+    amount_of_rows: int
+
+    @property
+    def all_rows(self) -> int:
+        """Set of all rows."""
+        return (1 << self.amount_of_rows) - 1
+
+    def gamma_rate(self) -> int:
+        """Determine gamma rate.
+
+        :return: Gamma rate
+        """
+        gamma_rate = 0
+        for column in self.columns:
+            gamma_rate = gamma_rate << 1 | (
+                    2 * column.bit_count() >= self.amount_of_rows)
+        return gamma_rate
+
+    def epsilon_rate(self) -> int:
+        """Determine epsilon rate.
+
+        :return: Epsilon rate
+        """
+        return ~self.gamma_rate() & (1 << len(self.columns)) - 1
+
+    def oxygen_generator_rating(self) -> int:
+        """Determine oxygen generator rating.
+
+        :return: Oxygen generator rating
+        """
+        return self._determine_rating(True)
+
+    def co2_scrubber_rating(self) -> int:
+        """Determine CO2 scrubber rating.
+
+        :return: CO2 scrubber rating
+        """
+        return self._determine_rating(False)
+
+    def _determine_rating(self, keep_most_common_bit: bool) -> int:
+        """Determine a rating by narrowing the set of rows column by column.
+
+        On a tie the rows with a 1 are kept for the most common bit and the
+        rows with a 0 for the least common bit.
+
+        :param keep_most_common_bit: Whether the rows with the most common bit
+                                     or with the least common bit are kept
+        :return: Rating
+        """
+        rows = self.all_rows
+        for column in self.columns:
+            if rows.bit_count() == 1:
+                break
+            ones, zeros = rows & column, rows & ~column
+            amount_of_ones = ones.bit_count()
+            amount_of_zeros = zeros.bit_count()
+            if amount_of_ones and amount_of_zeros and (
+                    amount_of_ones >= amount_of_zeros) != keep_most_common_bit:
+                rows = zeros
+            elif amount_of_ones:
+                rows = ones
+        if rows.bit_count() != 1:
+            raise Exception
+        rating = 0
+        for column in self.columns:
+            rating = rating << 1 | bool(column & rows)
+        return rating
+
+
+def data_input(filename: str = "data") -> DiagnosticReport:
     """Read diagnostic report.
 
     :param filename: Filename
     :return: Diagnostic report
     """
     with open(filename) as file:
-        return [BinaryNumber(line) for line in file.read().splitlines()]
+        lines = file.read().split()
+    width = len(lines[0]) if lines else 0
+    bits = "".join(lines)
+    return DiagnosticReport(sorted(int(line, 2) for line in lines), width,
+                            [bits[column::width].count("1") for column in
+                             range(width)])
 
 
-def determine_gamma_rate(diagnostic_report: list[BinaryNumber]) -> int:
+def packed_data_input(filename: str = "data") -> PackedDiagnosticReport:
+    """Read diagnostic report into packed bit columns.
+
+    All lines must have the same length. Each column is taken from the
+    memory-mapped file with a single strided slice and parsed at once.
+
+    :param filename: Filename
+    :return: Diagnostic report stored as packed bit columns
+    """
+    with open(filename, "rb") as file:
+        if not file.seek(0, 2):
+            return PackedDiagnosticReport([], 0)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            stride = mapped.find(b"\n") + 1 or len(mapped) + 1
+            width = len(mapped[:stride].rstrip())
+            amount_of_rows = (len(mapped) + 1) // stride
+            return PackedDiagnosticReport(
+                [int(mapped[column::stride], 2) for column in range(width)],
+                amount_of_rows)
+
+
+def determine_gamma_rate(diagnostic_report: DiagnosticReport) -> int:
     """Determine gamma rate.
 
     :param diagnostic_report: Diagnostic report
     :return: Gamma rate
     """
-    binary_numbers = _transpose_binary_numbers(diagnostic_report)
-    gamma_rate_binary: BinaryNumber = BinaryNumber(
-        "".join([Counter(row).most_common(1)[0][0] for row in binary_numbers]))
-    return int(gamma_rate_binary, 2)
+    amount_of_numbers = len(diagnostic_report.numbers)
+    gamma_rate = 0
+    for count in diagnostic_report.ones_per_column:
+        gamma_rate = gamma_rate << 1 | (2 * count >= amount_of_numbers)
+    return gamma_rate
 
 
-def determine_epsilon_rate(diagnostic_report: list[BinaryNumber]) -> int:
+def determine_epsilon_rate(diagnostic_report: DiagnosticReport) -> int:
     """Determine epsilon rate.
 
+    The epsilon rate is the bitwise complement of the gamma rate.
+
     :param diagnostic_report: Diagnostic report
     :return: Epsilon rate
     """
-    binary_numbers = _transpose_binary_numbers(diagnostic_report)
-    epsilon_rate_binary: BinaryNumber = BinaryNumber(
-        "".join(
-            ["1" if Counter(row).most_common(1)[0][0] == "0" else "0" for row
-             in binary_numbers]))
-    return int(epsilon_rate_binary, 2)
+    return ~determine_gamma_rate(diagnostic_report) & diagnostic_report.mask
 
 
 def determine_oxygen_generator_rating(
-        diagnostic_report: list[BinaryNumber]) -> int:
+        diagnostic_report: DiagnosticReport) -> int:
     """Determine oxygen generator rating.
 
     :param diagnostic_report: Diagnostic report
     :return: Oxygen generator rating
     """
-    available_binary_numbers = diagnostic_report.copy()
-    for index, _ in enumerate(diagnostic_report[0]):
-        binary_numbers = _transpose_binary_numbers(available_binary_numbers)
-        most_common_bit = _determine_most_common_bit(binary_numbers[index])
-        new_available_binary_numbers = [binary_number for binary_number in
-                                        available_binary_numbers if
-                                        binary_number[
-                                            index] == most_common_bit]
-        if len(new_available_binary_numbers) == 1:
-            return int(new_available_binary_numbers[0], 2)
-        available_binary_numbers = new_available_binary_numbers
-    raise Exception
+    return _determine_rating(diagnostic_report, True)
 
 
 def determine_co2_scrubber_rating(
-        diagnostic_report: list[BinaryNumber]) -> int:
+        diagnostic_report: DiagnosticReport) -> int:
     """Determine CO2 scrubber rating.
 
     :param diagnostic_report: Diagnostic report
     :return: CO2 scrubber rating
     """
-    available_binary_numbers = diagnostic_report.copy()
-    for index in range(len(diagnostic_report[0])):
-        binary_numbers = _transpose_binary_numbers(available_binary_numbers)
-        least_common_bit = _determine_least_common_bit(binary_numbers[index])
-        new_available_binary_numbers = [binary_number for binary_number in
-                                        available_binary_numbers if
-                                        binary_number[
-                                            index] == least_common_bit]
-        if len(new_available_binary_numbers) == 1:
-            return int(new_available_binary_numbers[0], 2)
-        available_binary_numbers = new_available_binary_numbers
-    raise Exception
+    return _determine_rating(diagnostic_report, False)
 
 
-def part_1(diagnostic_report: list[BinaryNumber]) -> int:
+def part_1(diagnostic_report: DiagnosticReport) -> int:
     """Part 1.
 
     :param diagnostic_report: Diagnostic report
     :return: Power consumption
     """
-    return determine_gamma_rate(diagnostic_report) * determine_epsilon_rate(
-        diagnostic_report)
+    gamma_rate = determine_gamma_rate(diagnostic_report)
+    return gamma_rate * (~gamma_rate & diagnostic_report.mask)
 
 
-def part_2(diagnostic_report: list[BinaryNumber]) -> int:
+def part_2(diagnostic_report: DiagnosticReport) -> int:
     """Part 2.
 
     :param diagnostic_report: Diagnostic report
@@ -113,52 +210,35 @@ def main() -> None:
     print(part_2(diagnostic_report))
 
 
-def _transpose_binary_numbers(diagnostic_report: list[BinaryNumber]) -> \
-        list[BinaryNumber]:
-    """Transpose a list of binary numbers.
-
-    :param diagnostic_report: Diagnostic report
-    :return: List of binary numbers
-    """
-    return [BinaryNumber(
-        "".join([number_string[index] for number_string in diagnostic_report]))
-        for index, _ in enumerate(diagnostic_report[0])]
-
+def _determine_rating(diagnostic_report: DiagnosticReport,
+                      keep_most_common_bit: bool) -> int:
+    """Determine a rating by narrowing the range of sorted numbers bit by bit.
 
-def _determine_most_common_bit(binary_number: BinaryNumber) -> str:
-    """Determine the most common bit of a binary number.
+    On a tie the numbers with a 1 are kept for the most common bit and the
+    numbers with a 0 for the least common bit.
 
-    :param binary_number: Binary number
-    :return: The most common bit
-    """
-    count = Counter(binary_number)
-    most_common_bits_in_row = count.most_common(2)
-    if len(count) == 1:
-        return most_common_bits_in_row[0][0]
-    if most_common_bits_in_row[0][1] == most_common_bits_in_row[1][1]:
-        return "1"
-    return most_common_bits_in_row[0][0]
-
-
-def _determine_least_common_bit(binary_number: BinaryNumber) -> str:
-    """Determine the least common bit of a binary number.
-
-    :param binary_number: Binary number
-    :return: The least common bit
+    :param diagnostic_report: Diagnostic report
+    :param keep_most_common_bit: Whether the numbers with the most common bit
+                                 or with the least common bit are kept
+    :return: Rating
     """
-    count = Counter(binary_number)
-    most_common_bits_in_row = count.most_common(2)
-    if len(count) == 1:
-        least_common_bit = most_common_bits_in_row[0][0]
-    else:
-        if most_common_bits_in_row[0][1] == most_common_bits_in_row[1][1]:
-            least_common_bit = "0"
-        else:
-            if most_common_bits_in_row[0][0] == "0":
-                least_common_bit = "1"
-            else:
-                least_common_bit = "0"
-    return least_common_bit
+    numbers = diagnostic_report.numbers
+    low, high = 0, len(numbers)
+    prefix = 0
+    for shift in reversed(range(diagnostic_report.width)):
+        if high - low == 1:
+            break
+        bit = 1 << shift
+        split = bisect_left(numbers, prefix | bit, low, high)
+        ones, zeros = high - split, split - low
+        if ones and zeros and (ones >= zeros) != keep_most_common_bit:
+            high = split
+        elif ones:
+            low = split
+            prefix |= bit
+    if high - low == 1:
+        return numbers[low]
+    raise Exception
 
 
 if __name__ == "__main__":
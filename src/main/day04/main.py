@@ -13,28 +13,48 @@ class BoardSquare(NamedTuple):
 
 
 class Board(list[list[BoardSquare]]):
-    """Board."""
-    board_length: int = 5
+    """Board.
+
+    Besides the squares, every board keeps an index from numbers to their
+    squares and the number of marked squares per row and per column, so
+    marking a number and detecting a win only cost time per hit square. The
+    size of the board is given by its rows.
+    """
 
     def __init__(self, rows: list[str], number: int) -> None:
         super().__init__()
         self.number: int = number
         self._won_instruction: int = None
+        self._positions: dict[int, list[tuple[int, int]]] = {}
+        self._sum_of_unmarked_numbers: int = 0
         pattern = re.compile(r"\d+")
-        for row in rows:
+        for row_index, row in enumerate(rows):
             matches = [BoardSquare(int(number)) for number in
                        re.findall(pattern, row)]
+            for column_index, square in enumerate(matches):
+                self._positions.setdefault(square.number, []).append(
+                    (row_index, column_index))
+                self._sum_of_unmarked_numbers += square.number
             self.append(matches)
+        self.amount_of_rows: int = len(self)
+        self.amount_of_columns: int = len(self[0]) if self else 0
+        self._marked_per_row: list[int] = [0] * self.amount_of_rows
+        self._marked_per_column: list[int] = [0] * self.amount_of_columns
 
     @property
     def is_playable(self) -> bool:
         """Check if the board is playable."""
         return self._won_instruction is None
 
+    @property
+    def numbers(self) -> set[int]:
+        """Get the numbers on the board."""
+        return set(self._positions)
+
     @property
     def score(self) -> int:
         """Get the score."""
-        return self._sum_of_all_unmarked_numbers() * self._won_instruction
+        return self._sum_of_unmarked_numbers * self._won_instruction
 
     def play(self, instruction: int) -> None:
         """One play on the board with the given instruction.
@@ -44,37 +64,28 @@ class Board(list[list[BoardSquare]]):
 
         :param instruction: Number to mark
         """
-        if self._won_instruction:
+        if self._won_instruction is not None:
             return
-        self._mark_board(instruction)
-        if self._is_won():
-            self._won_instruction = instruction
-
-    def _mark_board(self, instruction: int) -> None:
-        for row_index, row in enumerate(self):
-            for square_index, square in enumerate(row):
-                if square.number == instruction:
-                    self[row_index][square_index] = BoardSquare(square.number,
-                                                                True)
-
-    def _is_won(self) -> bool:
-        return self._won_instruction is not None \
-               or self._is_won_on_row() \
-               or self._is_won_on_column()
+        for row_index, column_index in self._positions.get(instruction, ()):
+            if self._mark_square(row_index, column_index):
+                self._won_instruction = instruction
 
-    def _is_won_on_row(self) -> bool:
-        return any(all(marked for _, marked in row) for row in self)
+    def _mark_square(self, row_index: int, column_index: int) -> bool:
+        """Mark a square.
 
-    def _is_won_on_column(self) -> bool:
-        return any(
-            all(self[row_index][column_index].is_marked for row_index in
-                range(Board.board_length)) for column_index in
-            range(Board.board_length))
-
-    def _sum_of_all_unmarked_numbers(self) -> int:
-        return sum([sum(
-            [number for number, marked in row if not marked]) for row in
-            self])
+        :param row_index: Row of the square
+        :param column_index: Column of the square
+        :return: Whether the row or the column of the square is complete
+        """
+        square = self[row_index][column_index]
+        if square.is_marked:
+            return False
+        self[row_index][column_index] = BoardSquare(square.number, True)
+        self._sum_of_unmarked_numbers -= square.number
+        self._marked_per_row[row_index] += 1
+        self._marked_per_column[column_index] += 1
+        return self._marked_per_row[row_index] == self.amount_of_columns \
+            or self._marked_per_column[column_index] == self.amount_of_rows
 
 
 class Game(NamedTuple):
@@ -84,38 +95,127 @@ class Game(NamedTuple):
     won_board_numbers: list[int]
 
 
+class Win(NamedTuple):
+    """Win of a board."""
+    board_number: int
+    turn: int
+    score: int
+
+
 def data_input(filename: str = "data") -> Game:
     """Read game.
 
+    The boards are separated by empty lines and may be of any size.
+
     :param filename: Filename
     :return: Game
     """
     with open(filename) as file:
-        rows = file.read().splitlines()
-        instructions = [int(number) for number in rows[0].split(",")]
-        amount_of_boards = (len(rows[2:]) + 1) // (Board.board_length + 1)
-        boards = [Board(rows[2 + i * (Board.board_length + 1):2 + i * (
-                Board.board_length + 1) + Board.board_length], i) for i in
-                  range(amount_of_boards)]
+        instructions_block, *board_blocks = re.split(r"\n\s*\n",
+                                                     file.read().strip())
+        instructions = [int(number) for number in
+                        instructions_block.split(",")]
+        boards = [Board(board_block.splitlines(), i) for i, board_block in
+                  enumerate(board_blocks)]
         return Game(instructions, boards, [])
 
 
+def index_boards(boards: list[Board]) -> dict[int, list[Board]]:
+    """Index from numbers to the boards containing them.
+
+    :param boards: Boards
+    :return: Boards per number
+    """
+    boards_per_number: dict[int, list[Board]] = {}
+    for board in boards:
+        for number in board.numbers:
+            boards_per_number.setdefault(number, []).append(board)
+    return boards_per_number
+
+
+def determine_wins(game: Game) -> list[Win]:
+    """Determine the wins of all boards without playing the game.
+
+    With the turn of every number being the index of its first occurrence in
+    the instructions, a line is complete at the maximal turn of its numbers
+    and a board wins at the minimal such turn over all its lines. Boards which
+    never win are left out.
+
+    :param game: Game
+    :return: Wins of the boards in the order of the boards
+    """
+    amount_of_turns = len(game.instructions)
+    turns: dict[int, int] = {}
+    for turn, instruction in enumerate(game.instructions):
+        turns.setdefault(instruction, turn)
+    wins: list[Win] = []
+    for board in game.boards:
+        board_turns = [[turns.get(square.number, amount_of_turns) for square in
+                        row] for row in board]
+        won_turn = min(min(map(max, board_turns)),
+                       min(map(max, zip(*board_turns))))
+        if won_turn == amount_of_turns:
+            continue
+        sum_of_unmarked_numbers = sum(
+            square.number for row, row_turns in zip(board, board_turns) for
+            square, turn in zip(row, row_turns) if turn > won_turn)
+        wins.append(Win(board.number, won_turn, sum_of_unmarked_numbers *
+                        game.instructions[won_turn]))
+    return wins
+
+
+def win_order(win: Win) -> tuple[int, int]:
+    """Sort key ordering wins by turn and, within a turn, by board number.
+
+    :param win: Win
+    :return: Sort key
+    """
+    return win.turn, win.board_number
+
+
+def first_win(wins: list[Win]) -> Win:
+    """Win reported by part 1 from wins in the order of winning.
+
+    Of the boards winning with the first winning instruction, the last one in
+    the order of the boards is taken, like the last one of the boards winning
+    with the final winning instruction is the last win.
+
+    :param wins: Wins of the boards in the order of winning
+    :return: First win
+    """
+    return [win for win in wins if win.turn == wins[0].turn][-1]
+
+
+def play_game(game: Game) -> list[Win]:
+    """Play the game once until every board has won or no instructions are
+    left.
+
+    The wins are returned in the order in which the boards win, so the k-th
+    board to win is the k-th entry. Boards winning with the same instruction
+    are ordered by board number, that is in the order of the boards in the
+    input. Part 2 is the last entry and part 1 is given by first_win.
+
+    :param game: Game
+    :return: Wins of the boards in the order of winning
+    """
+    boards_per_number = index_boards(game.boards)
+    wins: list[Win] = []
+    for turn, instruction in enumerate(game.instructions):
+        if len(wins) == len(game.boards):
+            break
+        for board in _play_instruction(boards_per_number, instruction):
+            game.won_board_numbers.append(board.number)
+            wins.append(Win(board.number, turn, board.score))
+    return wins
+
+
 def part_1(game: Game) -> int:
     """Part 1.
 
     :param game: Game
     :return: Final score of the first won game
     """
-    boards = game.boards
-    for instruction in game.instructions:
-        for board in boards:
-            board.play(instruction)
-        game.won_board_numbers.extend(
-            board.number for board in boards if not board.is_playable)
-        boards = [board for board in boards if board.is_playable]
-        if game.won_board_numbers:
-            return game.boards[game.won_board_numbers[-1]].score
-    raise Exception
+    return first_win(sorted(determine_wins(game), key=win_order)).score
 
 
 def part_2(game: Game) -> int:
@@ -124,26 +224,31 @@ def part_2(game: Game) -> int:
     :param game: Game
     :return: Final score of the last won game
     """
-    boards = game.boards
-    for instruction in game.instructions:
-        if not boards:
-            break
-        for board in boards:
-            board.play(instruction)
-        game.won_board_numbers.extend(
-            board.number for board in boards if not board.is_playable)
-        boards = [board for board in boards if board.is_playable]
-    if game.won_board_numbers:
-        return game.boards[game.won_board_numbers[-1]].score
-    raise Exception
+    return max(determine_wins(game), key=win_order).score
 
 
 def main() -> None:
     """Main function."""
-    game = data_input()
-    print(part_1(game))
-    game = data_input()
-    print(part_2(game))
+    wins = play_game(data_input())
+    print(first_win(wins).score)
+    print(wins[-1].score)
+
+
+def _play_instruction(boards_per_number: dict[int, list[Board]],
+                      instruction: int) -> list[Board]:
+    """Play an instruction on all playable boards containing it.
+
+    :param boards_per_number: Boards per number
+    :param instruction: Number to mark
+    :return: Boards won with this instruction
+    """
+    won_boards: list[Board] = []
+    for board in boards_per_number.get(instruction, []):
+        if board.is_playable:
+            board.play(instruction)
+            if not board.is_playable:
+                won_boards.append(board)
+    return won_boards
 
 
 if __name__ == "__main__":
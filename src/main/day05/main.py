@@ -2,60 +2,69 @@
 https://adventofcode.com/2021/day/5
 """
 
+import os
 import re
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-from typing import NewType
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, groupby
+from operator import itemgetter
+from typing import NamedTuple, NewType, Optional
 
-Instruction = NewType("Instruction", tuple[complex, complex])
+Interval = NewType("Interval", tuple[int, int])
+
+
+class Instruction(NamedTuple):
+    """Instruction with the integer coordinates of both endpoints."""
+    x_1: int
+    y_1: int
+    x_2: int
+    y_2: int
+
+    @property
+    def direction(self) -> tuple[int, int]:
+        """Unit step from the first to the second endpoint."""
+        return ((self.x_2 > self.x_1) - (self.x_2 < self.x_1),
+                (self.y_2 > self.y_1) - (self.y_2 < self.y_1))
+
+    @property
+    def length(self) -> int:
+        """Number of steps from the first to the second endpoint."""
+        return max(abs(self.x_2 - self.x_1), abs(self.y_2 - self.y_1))
 
 
 class Plane(defaultdict):
-    """Plane."""
-
-    def mark_horizontally(self,
-                          instructions: list[Instruction]) -> None:
-        """Mark plane with all horizontal instructions."""
-        horizontal_instructions = [instruction for instruction in instructions
-                                   if
-                                   instruction[0].imag == instruction[1].imag]
-
-        for line in horizontal_instructions:
-            horizontal_dimensions = (int(min(line[0].real, line[1].real)),
-                                     int(max(line[0].real, line[1].real)))
-
-            for horizontal_index in range(horizontal_dimensions[0],
-                                          horizontal_dimensions[1] + 1):
-                self[complex(horizontal_index, line[0].imag)] += 1
-
-    def mark_vertically(self,
-                        instructions: list[Instruction]) -> None:
-        """Mark plane with all vertical instructions."""
-        vertical_instructions = [instruction for instruction in instructions if
-                                 instruction[0].real == instruction[1].real]
-        for line in vertical_instructions:
-            vertical_dimensions = (int(min(line[0].imag, line[1].imag)),
-                                   int(max(line[0].imag, line[1].imag)))
-
-            for vertical_index in range(vertical_dimensions[0],
-                                        vertical_dimensions[1] + 1):
-                self[complex(line[0].real, vertical_index)] += 1
-
-    def mark_diagonally(self,
-                        instructions: list[Instruction]) -> None:
-        """Mark plane with all diagonal instructions."""
-        diagonal_instructions = [instruction for instruction in instructions if
-                                 instruction[0].real != instruction[1].real and
-                                 instruction[0].imag != instruction[1].imag]
-        for line in diagonal_instructions:
-            left_point = line[0] if line[0].real < line[1].real else line[1]
-            right_point = line[1] if left_point == line[0] else line[0]
-
-            direction: float = (right_point.imag - left_point.imag) / (
-                    right_point.real - left_point.real)
-            direction /= abs(direction)
-            slope: complex = complex(1, direction)
-            for i in range(int(abs(line[0].real - line[1].real)) + 1):
-                self[left_point + i * slope] += 1
+    """Plane.
+
+    Points are keyed by a single integer packing the y coordinate into the
+    upper and the x coordinate into the lower key_bits bits, so a step along
+    a line is a constant integer offset of the key.
+    """
+    key_bits: int = 32
+
+    def mark(self, instructions: list[Instruction],
+             diagonally: bool = False) -> None:
+        """Mark plane with all horizontal and vertical instructions and
+        optionally all diagonal instructions."""
+        for instruction in instructions:
+            direction_x, direction_y = instruction.direction
+            if direction_x and direction_y and not diagonally:
+                continue
+            key = self.key(instruction.x_1, instruction.y_1)
+            step = (direction_y << self.key_bits) + direction_x
+            for _ in range(instruction.length + 1):
+                self[key] += 1
+                key += step
+
+    @classmethod
+    def key(cls, x: int, y: int) -> int:
+        """Key of a point.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :return: Key of the point
+        """
+        return (y << cls.key_bits) + x
 
     def amount_of_points_with_at_least_two_overlaps(self) -> int:
         """Return the number of points where at least two lines overlap.
@@ -65,6 +74,131 @@ class Plane(defaultdict):
         return sum(value >= 2 for value in self.values())
 
 
+class Bounds(NamedTuple):
+    """Inclusive bounds of a rectangle in the plane."""
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+
+    @classmethod
+    def of(cls, instructions: list[Instruction]) -> "Bounds":
+        """Bounding box of the lines of instructions.
+
+        :param instructions: Instructions
+        :return: Bounding box
+        """
+        x_coordinates = [x for instruction in instructions for x in
+                         (instruction.x_1, instruction.x_2)]
+        y_coordinates = [y for instruction in instructions for y in
+                         (instruction.y_1, instruction.y_2)]
+        return cls(min(x_coordinates, default=0),
+                   min(y_coordinates, default=0),
+                   max(x_coordinates, default=0),
+                   max(y_coordinates, default=0))
+
+
+class GridPlane(bytearray):
+    """Plane stored as a dense grid over given bounds, by default the bounding
+    box of the lines.
+
+    The grid is flattened row by row, so every line is a slice of the grid
+    with a constant step and is marked at once by translating that slice.
+    Lines are clipped to the bounds. Counts saturate at 255.
+    """
+    _increment: bytes = bytes(range(1, 256)) + b"\xff"
+
+    def __init__(self, instructions: list[Instruction],
+                 bounds: Optional[Bounds] = None) -> None:
+        self.bounds: Bounds = bounds or Bounds.of(instructions)
+        self.width: int = self.bounds.max_x - self.bounds.min_x + 1
+        self.height: int = self.bounds.max_y - self.bounds.min_y + 1
+        super().__init__(self.width * self.height)
+
+    def mark(self, instructions: list[Instruction],
+             diagonally: bool = False) -> None:
+        """Mark plane with all horizontal and vertical instructions and
+        optionally all diagonal instructions."""
+        for instruction in instructions:
+            direction_x, direction_y = instruction.direction
+            if direction_x and direction_y and not diagonally:
+                continue
+            clipped_line = self._clip(instruction)
+            if clipped_line is None:
+                continue
+            start_index, end_index, length = clipped_line
+            step = (end_index - start_index) // length if length else 1
+            line = slice(start_index, end_index + 1, step)
+            self[line] = self[line].translate(self._increment)
+
+    def amount_of_points_with_at_least_two_overlaps(self) -> int:
+        """Return the number of points where at least two lines overlap.
+
+        :return: The number of points where at least two lines overlap
+        """
+        return len(self) - self.count(0) - self.count(1)
+
+    def _clip(self,
+              instruction: Instruction) -> Optional[tuple[int, int, int]]:
+        """Clip a line to the bounds.
+
+        :param instruction: Instruction
+        :return: Smaller and larger grid index of the clipped line and its
+                 length, or None if the line lies outside the bounds
+        """
+        direction_x, direction_y = instruction.direction
+        first, last = 0, instruction.length
+        for coordinate, direction, low, high in [
+                (instruction.x_1, direction_x, self.bounds.min_x,
+                 self.bounds.max_x),
+                (instruction.y_1, direction_y, self.bounds.min_y,
+                 self.bounds.max_y)]:
+            if direction == 0:
+                if not low <= coordinate <= high:
+                    return None
+                continue
+            steps = sorted(((low - coordinate) * direction,
+                            (high - coordinate) * direction))
+            first, last = max(first, steps[0]), min(last, steps[1])
+        if first > last:
+            return None
+        indices = sorted(self._index(instruction.x_1 + t * direction_x,
+                                     instruction.y_1 + t * direction_y) for
+                         t in (first, last))
+        return indices[0], indices[1], last - first
+
+    def _index(self, x: int, y: int) -> int:
+        return (y - self.bounds.min_y) * self.width + x - self.bounds.min_x
+
+
+class LineFamily(NamedTuple):
+    """Family of parallel lines.
+
+    A point (x, y) lies on the line key[0] * x + key[1] * y of the family at
+    the position position[0] * x + position[1] * y along that line.
+    """
+    key: tuple[int, int]
+    position: tuple[int, int]
+
+    def key_of(self, point: tuple[int, int]) -> int:
+        """Key of the line through a point."""
+        return self.key[0] * point[0] + self.key[1] * point[1]
+
+    def position_of(self, point: tuple[int, int]) -> int:
+        """Position of a point along its line."""
+        return self.position[0] * point[0] + self.position[1] * point[1]
+
+    def point(self, key: int, position: int) -> tuple[int, int]:
+        """Point with the given position on the line with the given key."""
+        return _solve(self.key, self.position, key, position)
+
+
+HORIZONTAL = LineFamily((0, 1), (1, 0))
+VERTICAL = LineFamily((1, 0), (0, 1))
+DIAGONAL = LineFamily((1, -1), (1, 0))
+ANTIDIAGONAL = LineFamily((1, 1), (1, 0))
+
+
 def data_input(filename: str = "data") -> list[Instruction]:
     """Read instructions.
 
@@ -76,22 +210,102 @@ def data_input(filename: str = "data") -> list[Instruction]:
         instructions: list[Instruction] = []
         for row in file.read().splitlines():
             match = re.match(pattern, row)
-            instructions.append(Instruction((complex(int(match.group(1)),
-                                                     int(match.group(2))),
-                                             complex(int(match.group(3)),
-                                                     int(match.group(4))))))
+            instructions.append(Instruction(*map(int, match.groups())))
         return instructions
 
 
+def count_overlaps_tiled(instructions: list[Instruction],
+                         diagonally: bool = False, tiles_per_side: int = 2,
+                         processes: Optional[int] = None) -> int:
+    """Count the points where at least two lines overlap tile by tile.
+
+    The bounding box of the lines is split into tiles_per_side x
+    tiles_per_side tiles. Every tile gets the lines crossing its bounds and is
+    rasterized as a GridPlane in a worker process, so a worker only holds the
+    grid of one tile.
+
+    :param instructions: Instructions
+    :param diagonally: Whether diagonal instructions are included
+    :param tiles_per_side: Number of tiles along each axis
+    :param processes: Number of worker processes, defaults to the CPU count
+    :return: The number of points where at least two lines overlap
+    """
+    bounds = Bounds.of(instructions)
+    x_borders = _split_range(bounds.min_x, bounds.max_x, tiles_per_side)
+    y_borders = _split_range(bounds.min_y, bounds.max_y, tiles_per_side)
+    tiles = [Bounds(min_x, min_y, max_x, max_y) for min_y, max_y in y_borders
+             for min_x, max_x in x_borders]
+    tile_instructions = [
+        [instruction for instruction in instructions if
+         _overlaps_bounds(instruction, tile)] for tile in tiles]
+    with ProcessPoolExecutor(
+            max_workers=processes or os.cpu_count() or 1) as executor:
+        return sum(executor.map(_count_overlaps_in_tile, tile_instructions,
+                                tiles, [diagonally] * len(tiles)))
+
+
+def count_overlaps_by_sweep(instructions: list[Instruction],
+                            diagonally: bool = False) -> int:
+    """Count the points where at least two lines overlap without visiting
+    the points of the lines.
+
+    The lines are grouped by family and by the line they lie on. Collinear
+    overlaps are found by sweeping over the endpoints on each line. Points
+    where lines of two different families cross are found by a sweep over
+    the lines of one family, keeping the crossed lines of the other family in
+    a sorted list. The cost depends on the number of lines and crossings but
+    not on the lengths of the lines.
+
+    :param instructions: Instructions
+    :param diagonally: Whether diagonal instructions are included
+    :return: The number of points where at least two lines overlap
+    """
+    intervals: dict[LineFamily, dict[int, list[Interval]]] = defaultdict(
+        lambda: defaultdict(list))
+    for instruction in instructions:
+        start_point = instruction.x_1, instruction.y_1
+        end_point = instruction.x_2, instruction.y_2
+        family = _determine_family(start_point, end_point)
+        if family is None or not diagonally and family in (DIAGONAL,
+                                                           ANTIDIAGONAL):
+            continue
+        positions = sorted((family.position_of(start_point),
+                            family.position_of(end_point)))
+        intervals[family][family.key_of(start_point)].append(
+            Interval(tuple(positions)))
+
+    covered: dict[LineFamily, dict[int, list[Interval]]] = {}
+    covered_twice: dict[LineFamily, dict[int, list[Interval]]] = {}
+    amount = 0
+    for family, intervals_per_key in intervals.items():
+        covered[family], covered_twice[family] = {}, {}
+        for key, line_intervals in intervals_per_key.items():
+            covered[family][key], covered_twice[family][key] = \
+                _merge_intervals(line_intervals)
+            amount += sum(high - low + 1 for low, high in
+                          covered_twice[family][key])
+
+    crossings: set[tuple[int, int]] = set()
+    for family_1, family_2 in combinations(covered, 2):
+        crossings.update(_crossings(family_1, covered[family_1], family_2,
+                                    covered[family_2]))
+    # A crossing point is counted once for every family overlapping itself
+    # there, but it has to be counted exactly once.
+    return amount + sum(
+        1 - sum(_is_in_intervals(
+            covered_twice[family].get(family.key_of(point), []),
+            family.position_of(point)) for family in covered_twice)
+        for point in crossings)
+
+
 def part_1(instructions: list[Instruction]) -> int:
     """Part 1.
 
     :param instructions: Instructions
     :return: The number of points where at least two lines overlap
     """
-    plane = Plane(int)
-    plane.mark_horizontally(instructions)
-    plane.mark_vertically(instructions)
+    plane = GridPlane(instructions)
+    plane.mark(instructions)
     return plane.amount_of_points_with_at_least_two_overlaps()
 
 
@@ -101,10 +315,8 @@ def part_2(instructions: list[Instruction]) -> int:
     :param instructions: Instructions
     :return: The number of points where at least two lines overlap
     """
-    plane = Plane(int)
-    plane.mark_horizontally(instructions)
-    plane.mark_vertically(instructions)
-    plane.mark_diagonally(instructions)
+    plane = GridPlane(instructions)
+    plane.mark(instructions, diagonally=True)
     return plane.amount_of_points_with_at_least_two_overlaps()
 
 
@@ -116,5 +328,171 @@ def main() -> None:
     print(part_2(instructions))
 
 
+def _split_range(low: int, high: int,
+                 amount_of_parts: int) -> list[tuple[int, int]]:
+    """Split an inclusive range into at most the given number of parts.
+
+    :param low: Start of the range
+    :param high: End of the range
+    :param amount_of_parts: Number of parts
+    :return: Non-empty inclusive parts of the range
+    """
+    length = high - low + 1
+    borders = [low + length * i // amount_of_parts for i in
+               range(amount_of_parts + 1)]
+    return [(start, end - 1) for start, end in zip(borders, borders[1:]) if
+            start < end]
+
+
+def _overlaps_bounds(instruction: Instruction, bounds: Bounds) -> bool:
+    """Check if the bounding box of a line overlaps given bounds.
+
+    :param instruction: Instruction
+    :param bounds: Bounds
+    :return: Whether the bounding box of the line overlaps the bounds
+    """
+    return min(instruction.x_1, instruction.x_2) <= bounds.max_x \
+        and max(instruction.x_1, instruction.x_2) >= bounds.min_x \
+        and min(instruction.y_1, instruction.y_2) <= bounds.max_y \
+        and max(instruction.y_1, instruction.y_2) >= bounds.min_y
+
+
+def _count_overlaps_in_tile(instructions: list[Instruction], bounds: Bounds,
+                            diagonally: bool) -> int:
+    """Count the points in a tile where at least two lines overlap.
+
+    :param instructions: Instructions crossing the tile
+    :param bounds: Bounds of the tile
+    :param diagonally: Whether diagonal instructions are included
+    :return: The number of points in the tile where at least two lines
+             overlap
+    """
+    plane = GridPlane(instructions, bounds)
+    plane.mark(instructions, diagonally)
+    return plane.amount_of_points_with_at_least_two_overlaps()
+
+
+def _solve(row_1: tuple[int, int], row_2: tuple[int, int], value_1: int,
+           value_2: int) -> Optional[tuple[int, int]]:
+    """Solve a linear 2x2 system over the integers.
+
+    :param row_1: Coefficients of the first equation
+    :param row_2: Coefficients of the second equation
+    :param value_1: Value of the first equation
+    :param value_2: Value of the second equation
+    :return: Integer solution or None if the solution is not integral
+    """
+    determinant = row_1[0] * row_2[1] - row_1[1] * row_2[0]
+    x, x_remainder = divmod(value_1 * row_2[1] - row_1[1] * value_2,
+                            determinant)
+    y, y_remainder = divmod(row_1[0] * value_2 - value_1 * row_2[0],
+                            determinant)
+    if x_remainder or y_remainder:
+        return None
+    return x, y
+
+
+def _determine_family(start: tuple[int, int],
+                      end: tuple[int, int]) -> Optional[LineFamily]:
+    """Determine the family of the line between two points.
+
+    :param start: Start point
+    :param end: End point
+    :return: Family of the line or None if the line has no supported angle
+    """
+    if start[1] == end[1]:
+        return HORIZONTAL
+    if start[0] == end[0]:
+        return VERTICAL
+    if end[0] - start[0] == end[1] - start[1]:
+        return DIAGONAL
+    if end[0] - start[0] == start[1] - end[1]:
+        return ANTIDIAGONAL
+    return None
+
+
+def _merge_intervals(intervals: list[Interval]) -> tuple[list[Interval],
+                                                         list[Interval]]:
+    """Merge closed integer intervals on a line.
+
+    :param intervals: Closed integer intervals
+    :return: Sorted disjoint intervals covered at least once and covered at
+             least twice
+    """
+    events = sorted([(low, 1) for low, _ in intervals] +
+                    [(high + 1, -1) for _, high in intervals])
+    covered: list[Interval] = []
+    covered_twice: list[Interval] = []
+    starts: dict[int, int] = {}
+    depth = 0
+    for position, changes in groupby(events, key=itemgetter(0)):
+        new_depth = depth + sum(change for _, change in changes)
+        for minimal_depth, merged in [(1, covered), (2, covered_twice)]:
+            if depth < minimal_depth <= new_depth:
+                starts[minimal_depth] = position
+            elif new_depth < minimal_depth <= depth:
+                merged.append(Interval((starts[minimal_depth], position - 1)))
+        depth = new_depth
+    return covered, covered_twice
+
+
+def _crossings(family_1: LineFamily,
+               intervals_1: dict[int, list[Interval]],
+               family_2: LineFamily,
+               intervals_2: dict[int, list[Interval]]) -> set[tuple[int, int]]:
+    """Points where lines of two different families cross.
+
+    In the coordinates given by the keys of both families, the lines of the
+    first family are vertical and the lines of the second family horizontal.
+    The lines are swept from left to right while the keys of the currently
+    crossed lines of the second family are kept in a sorted list.
+
+    :param family_1: First family
+    :param intervals_1: Intervals covered by lines of the first family
+    :param family_2: Second family
+    :param intervals_2: Intervals covered by lines of the second family
+    :return: Points where lines of both families cross
+    """
+    insert, query, remove = range(3)
+    events: list[tuple[int, int, int, int]] = []
+    for key, line_intervals in intervals_2.items():
+        for low, high in line_intervals:
+            keys = sorted((family_1.key_of(family_2.point(key, low)),
+                           family_1.key_of(family_2.point(key, high))))
+            events.append((keys[0], insert, key, key))
+            events.append((keys[1], remove, key, key))
+    for key, line_intervals in intervals_1.items():
+        for low, high in line_intervals:
+            keys = sorted((family_2.key_of(family_1.point(key, low)),
+                           family_2.key_of(family_1.point(key, high))))
+            events.append((key, query, keys[0], keys[1]))
+
+    crossings: set[tuple[int, int]] = set()
+    active: list[int] = []
+    for key_1, kind, low, high in sorted(events):
+        if kind == insert:
+            insort(active, low)
+        elif kind == remove:
+            del active[bisect_left(active, low)]
+        else:
+            for key_2 in active[bisect_left(active, low):
+                                bisect_right(active, high)]:
+                point = _solve(family_1.key, family_2.key, key_1, key_2)
+                if point is not None:
+                    crossings.add(point)
+    return crossings
+
+
+def _is_in_intervals(intervals: list[Interval], position: int) -> bool:
+    """Check if a position lies in one of sorted disjoint intervals.
+
+    :param intervals: Sorted disjoint closed intervals
+    :param position: Position
+    :return: Whether the position lies in one of the intervals
+    """
+    index = bisect_right(intervals, (position, float("inf"))) - 1
+    return index >= 0 and intervals[index][1] >= position
+
+
 if __name__ == "__main__":
     main()
@@ -2,8 +2,12 @@
 https://adventofcode.com/2021/day/6
 """
 
-from collections import Counter
+from collections import Counter, deque
 from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+Matrix = list[list[int]]
 
 
 class LanternfishSchool:
@@ -27,19 +31,139 @@ class LanternfishSchool:
             self._amount_of_lanternfish_for_one_fish(age, days) * amount for
             age, amount in count_of_different_ages.items())
 
-    @lru_cache(maxsize=256)
-    def _amount_of_lanternfish_for_one_fish(self, start_age: int,
-                                            days: int) -> int:
+    def iterate_amounts_of_lanternfish(self) -> Iterator[int]:
+        """Iterate over the amounts of lanternfish day by day, starting with
+        day 0.
+
+        The amounts per age are kept in a ring buffer which is rotated by one
+        age every day.
+
+        :return: Iterator over the amounts of lanternfish per day
+        """
+        amounts_per_age = deque([0] * self.initial_evolution_period)
+        for age in self.initial_ages_of_lanternfishes:
+            amounts_per_age[age] += 1
+        amount = self.amount_of_lanternfishes
+        while True:
+            yield amount
+            spawning = amounts_per_age[0]
+            amounts_per_age.rotate(-1)
+            amounts_per_age[self.evolution_period - 1] += spawning
+            amount += spawning
+
+    def get_amounts_of_lanternfish(self, days: Iterable[int]) -> list[int]:
+        """Get amounts of lanternfish for several amounts of days in a single
+        pass.
+
+        :param days: Amounts of days
+        :return: Amounts of lanternfish for the given amounts of days
+        """
+        days = list(days)
+        requested_days = set(days)
+        amounts: dict[int, int] = {}
+        for day, amount in enumerate(islice(
+                self.iterate_amounts_of_lanternfish(),
+                max(requested_days, default=-1) + 1)):
+            if day in requested_days:
+                amounts[day] = amount
+        return [amounts[day] for day in days]
+
+    def get_amount_of_lanternfish_by_matrix_power(
+            self, days: int, modulus: Optional[int] = None) -> int:
+        """Get amount of lanternfish for given amount of days by raising the
+        transition matrix of the ages to the power of days.
+
+        The matrix is squared O(log days) times, so very large amounts of days
+        are feasible, in particular with a modulus.
+
+        :param days: Non-negative amount of days
+        :param modulus: Optional positive modulus of the result
+        :return: Amount of lanternfish for given amount of days, reduced by
+                 the modulus if given
+        """
+        if days < 0:
+            raise ValueError(
+                f"Amount of days must be non-negative, got {days}")
+        if modulus is not None and modulus < 1:
+            raise ValueError(f"Modulus must be positive, got {modulus}")
+        amounts_per_age = [0] * self.initial_evolution_period
+        for age in self.initial_ages_of_lanternfishes:
+            amounts_per_age[age] += 1
+        power = _matrix_power(self._transition_matrix(), days, modulus)
+        amount = sum(entry * amount for row in power for entry, amount in
+                     zip(row, amounts_per_age))
+        return amount if modulus is None else amount % modulus
+
+    @classmethod
+    def _transition_matrix(cls) -> Matrix:
+        """Matrix mapping the amounts per age to those of the next day."""
+        matrix = [[0] * cls.initial_evolution_period for _ in
+                  range(cls.initial_evolution_period)]
+        for age in range(1, cls.initial_evolution_period):
+            matrix[age - 1][age] = 1
+        matrix[cls.evolution_period - 1][0] = 1
+        matrix[cls.initial_evolution_period - 1][0] = 1
+        return matrix
+
+    @staticmethod
+    @lru_cache(maxsize=65_536)
+    def _amount_of_lanternfish_for_one_fish(start_age: int, days: int) -> int:
+        """Amount of lanternfish descending from one fish, including itself.
+
+        The results only depend on the age and the amount of days, so they are
+        kept in one process-wide table shared by all schools, with the least
+        recently used entries evicted once the table is full.
+
+        :param start_age: Age of the fish
+        :param days: Amount of days
+        :return: Amount of lanternfish after given amount of days
+        """
         days -= start_age + 1
         if days < 0:
             return 1
-        amount: int = days // self.evolution_period + 1
-        return sum(self._amount_of_lanternfish_for_one_fish(
-            self.initial_evolution_period - 1,
-            days - i * self.evolution_period)
+        amount: int = days // LanternfishSchool.evolution_period + 1
+        return sum(LanternfishSchool._amount_of_lanternfish_for_one_fish(
+            LanternfishSchool.initial_evolution_period - 1,
+            days - i * LanternfishSchool.evolution_period)
                    for i in range(amount)) + 1
 
 
+def _matrix_product(matrix_1: Matrix, matrix_2: Matrix,
+                    modulus: Optional[int] = None) -> Matrix:
+    """Product of two square matrices.
+
+    :param matrix_1: Left matrix
+    :param matrix_2: Right matrix
+    :param modulus: Optional modulus of the entries
+    :return: Product of the matrices
+    """
+    columns = list(zip(*matrix_2))
+    product = [[sum(entry_1 * entry_2 for entry_1, entry_2 in zip(row, column))
+                for column in columns] for row in matrix_1]
+    if modulus is not None:
+        product = [[entry % modulus for entry in row] for row in product]
+    return product
+
+
+def _matrix_power(matrix: Matrix, exponent: int,
+                  modulus: Optional[int] = None) -> Matrix:
+    """Power of a square matrix by repeated squaring.
+
+    :param matrix: Matrix
+    :param exponent: Non-negative exponent
+    :param modulus: Optional modulus of the entries
+    :return: Power of the matrix
+    """
+    power = [[int(row_index == column_index) for column_index in
+              range(len(matrix))] for row_index in range(len(matrix))]
+    while exponent:
+        if exponent & 1:
+            power = _matrix_product(power, matrix, modulus)
+        matrix = _matrix_product(matrix, matrix, modulus)
+        exponent >>= 1
+    return power
+
+
 def data_input(filename: str = "data") -> LanternfishSchool:
     """Read instructions.
 
@@ -2,7 +2,16 @@
 https://adventofcode.com/2021/day/7
 """
 
-from typing import Callable
+from collections import Counter
+from itertools import accumulate
+from typing import Callable, NamedTuple
+
+
+class TotalFuels(NamedTuple):
+    """Total fuels for every position between the outermost crabs."""
+    first_position: int
+    linear: list[int]
+    triangular: list[int]
 
 
 def data_input(filename: str = "data") -> list[int]:
@@ -28,21 +37,115 @@ def sum_of_first_n_integers(n: int) -> int:
 
 
 def determine_minimum_fuel(crab_horizontal_positions: list[int],
-                           fuel_function: Callable[[int], int]) -> int:
+                           fuel_function: Callable[[int], int],
+                           convex: bool = False) -> int:
     """Determine the minimum fuel for the crabs with respect to a given fuel
     function.
 
+    If the fuel function is declared convex and non-decreasing, the total fuel
+    is convex in the target position and the minimum is found by a binary
+    search over the positions. Otherwise every position is tried.
+
     :param crab_horizontal_positions: Horizontal positions of the crabs
     :param fuel_function: A function which describes the fuel needed to move a
     given amount of positions.
+    :param convex: Whether the fuel function is convex and non-decreasing
+    :return: Minimum fuel
+    """
+    amounts_per_position = Counter(crab_horizontal_positions)
+
+    def total_fuel(target_position: int) -> int:
+        return sum(amount * fuel_function(abs(position - target_position)) for
+                   position, amount in amounts_per_position.items())
+
+    if not convex:
+        return min(total_fuel(target_position) for target_position in
+                   range(min(amounts_per_position),
+                         max(amounts_per_position) + 1))
+
+    low, high = min(amounts_per_position), max(amounts_per_position)
+    while low < high:
+        middle = (low + high) // 2
+        if total_fuel(middle) <= total_fuel(middle + 1):
+            high = middle
+        else:
+            low = middle + 1
+    return total_fuel(low)
+
+
+def determine_total_fuels(crab_horizontal_positions: list[int]) -> TotalFuels:
+    """Determine the total fuel for every position for a linear and a
+    quadratic fuel consumption.
+
+    With the amount of crabs per position and the prefix sums of the amounts
+    and of the amounts times the positions, the total distance to any
+    position is known in constant time. The quadratic consumption
+    1 + 2 + ... + d = (d^2 + d) / 2 additionally needs the sum of squared
+    distances, which follows from the totals of the amounts, the positions
+    and the squared positions.
+
+    :param crab_horizontal_positions: Horizontal positions of the crabs
+    :return: Total fuels for every position between the outermost crabs
+    """
+    first_position = min(crab_horizontal_positions)
+    amounts = [0] * (max(crab_horizontal_positions) - first_position + 1)
+    for position in crab_horizontal_positions:
+        amounts[position - first_position] += 1
+    amounts_up_to = list(accumulate(amounts))
+    position_sums_up_to = list(accumulate(
+        position * amount for position, amount in enumerate(amounts)))
+    amount_of_crabs = amounts_up_to[-1]
+    position_sum = position_sums_up_to[-1]
+    squared_position_sum = sum(position * position * amount for
+                               position, amount in enumerate(amounts))
+
+    linear: list[int] = []
+    triangular: list[int] = []
+    for position, (amount_up_to, position_sum_up_to) in enumerate(
+            zip(amounts_up_to, position_sums_up_to)):
+        distance_sum = (position * amount_up_to - position_sum_up_to
+                        + position_sum - position_sum_up_to
+                        - position * (amount_of_crabs - amount_up_to))
+        squared_distance_sum = (squared_position_sum
+                                - 2 * position * position_sum
+                                + position * position * amount_of_crabs)
+        linear.append(distance_sum)
+        triangular.append((squared_distance_sum + distance_sum) // 2)
+    return TotalFuels(first_position, linear, triangular)
+
+
+def determine_minimum_linear_fuel(
+        crab_horizontal_positions: list[int]) -> int:
+    """Determine the minimum fuel for a linear fuel consumption.
+
+    The sum of distances is minimal at a median of the positions.
+
+    :param crab_horizontal_positions: Horizontal positions of the crabs
+    :return: Minimum fuel
+    """
+    median = sorted(crab_horizontal_positions)[
+        len(crab_horizontal_positions) // 2]
+    return sum(abs(position - median) for position in
+               crab_horizontal_positions)
+
+
+def determine_minimum_triangular_fuel(
+        crab_horizontal_positions: list[int]) -> int:
+    """Determine the minimum fuel for a quadratic fuel consumption, where
+    moving n positions costs 1 + 2 + ... + n.
+
+    The total fuel is convex and minimal at a real position within 1/2 of the
+    mean of the positions, so only the integers next to that interval have to
+    be checked.
+
+    :param crab_horizontal_positions: Horizontal positions of the crabs
     :return: Minimum fuel
     """
-    total_fuels = [
-        sum(fuel_function(abs(crab_horizontal_position - pos)) for pos in
-            crab_horizontal_positions) for crab_horizontal_position
-        in range(min(crab_horizontal_positions),
-                 max(crab_horizontal_positions) + 1)]
-    return min(total_fuels)
+    mean = sum(crab_horizontal_positions) // len(crab_horizontal_positions)
+    return min(
+        sum(sum_of_first_n_integers(abs(position - candidate)) for position in
+            crab_horizontal_positions) for candidate in
+        range(mean - 1, mean + 3))
 
 
 def part_1(crab_horizontal_positions: list[int]) -> int:
@@ -51,7 +154,7 @@ def part_1(crab_horizontal_positions: list[int]) -> int:
     :param crab_horizontal_positions: Horizontal positions of the crabs
     :return: Minimum total fuel for a linear fuel consumption
     """
-    return determine_minimum_fuel(crab_horizontal_positions, lambda n: n)
+    return determine_minimum_linear_fuel(crab_horizontal_positions)
 
 
 def part_2(crab_horizontal_positions: list[int]) -> int:
@@ -60,8 +163,7 @@ def part_2(crab_horizontal_positions: list[int]) -> int:
     :param crab_horizontal_positions: Horizontal positions of the crabs
     :return: Minimum total fuel for a quadratic fuel consumption
     """
-    return determine_minimum_fuel(crab_horizontal_positions,
-                                  sum_of_first_n_integers)
+    return determine_minimum_triangular_fuel(crab_horizontal_positions)
 
 
 def main() -> None:
@@ -3,6 +3,7 @@ https://adventofcode.com/2021/day/8
 """
 
 import re
+from collections import Counter
 
 
 class Decoder:
@@ -82,6 +83,26 @@ class Decoder:
         return self.display_to_numbers["".join(sorted(encoded_number))]
 
 
+def determine_fingerprints(
+        numbers_to_display: dict[int, str]) -> dict[int, int]:
+    """Determines the fingerprint of every number.
+
+    The fingerprint of a number is the sum over its segments of how often the
+    segment occurs in all ten numbers. It does not depend on the wiring and
+    is unique for every number.
+
+    :param numbers_to_display: Segments of every number
+    :return: Numbers per fingerprint
+    """
+    occurrences = Counter("".join(numbers_to_display.values()))
+    return {sum(occurrences[letter] for letter in display): number for
+            number, display in numbers_to_display.items()}
+
+
+FINGERPRINT_TO_NUMBER: dict[int, int] = determine_fingerprints(
+    Decoder.original_numbers_to_display)
+
+
 def data_input(filename: str = "data") -> list[tuple[list[str], list[str]]]:
     """Reads data.
 
@@ -131,6 +152,22 @@ def determine_output_value(entry: tuple[list[str], list[str]]) -> int:
                enumerate(entry[1]))
 
 
+def determine_output_value_by_fingerprint(
+        entry: tuple[list[str], list[str]]) -> int:
+    """Determines the output value from the fingerprints of the encoded
+    numbers without determining the wiring.
+
+    :param entry: List with encoded numbers and encoded output value
+    :return: Decoded output value
+    """
+    occurrences = Counter("".join(entry[0]))
+    output_value = 0
+    for encoded_number in entry[1]:
+        output_value = 10 * output_value + FINGERPRINT_TO_NUMBER[
+            sum(occurrences[letter] for letter in encoded_number)]
+    return output_value
+
+
 def part_1(data: list[tuple[list[str], list[str]]]) -> int:
     """Part 1.
 
@@ -151,7 +188,7 @@ def part_2(data: list[tuple[list[str], list[str]]]) -> int:
     :param data: List of list with encoded numbers and encoded output value
     :return: Sum of all output values
     """
-    return sum(determine_output_value(entry) for entry in data)
+    return sum(determine_output_value_by_fingerprint(entry) for entry in data)
 
 
 def main() -> None:
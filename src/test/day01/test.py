@@ -4,7 +4,9 @@ Tests for day 01.
 
 import unittest
 
-from src.main.day01.main import data_input, part_1, part_2
+from src.main.day01.main import SonarSweepCounter, count_window_increases, \
+    data_input, data_stream, parallel_sonar_sweep, part_1, part_2, \
+    sonar_sweep
 
 
 class TestDay01(unittest.TestCase):
@@ -30,6 +32,82 @@ class TestDay01(unittest.TestCase):
                 measurements = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(measurements))
 
+    def test_sonar_sweep(self) -> None:
+        """Testing sonar_sweep."""
+        subtest_list: list[tuple[str, tuple[int, int]]] = [
+            ("test_data_1", (7, 5)),
+            ("data", (1624, 1653))
+        ]
+        for filename, expected_result in subtest_list:
+            with self.subTest():
+                self.assertEqual(
+                    expected_result,
+                    sonar_sweep(data_stream(self.directory + filename)))
+                with open(self.directory + filename) as file:
+                    self.assertEqual(expected_result, sonar_sweep(file))
+                with open(self.directory + filename) as file:
+                    self.assertEqual(expected_result,
+                                     sonar_sweep(file.read().splitlines()))
+
+    def test_parallel_sonar_sweep(self) -> None:
+        """Testing parallel_sonar_sweep."""
+        subtest_list: list[tuple[str, int, tuple[int, int]]] = [
+            ("test_data_1", 1, (7, 5)),
+            ("test_data_1", 3, (7, 5)),
+            ("test_data_1", 8, (7, 5)),
+            ("test_data_1", 16, (7, 5)),
+            ("data", 4, (1624, 1653))
+        ]
+        for filename, processes, expected_result in subtest_list:
+            with self.subTest():
+                self.assertEqual(expected_result,
+                                 parallel_sonar_sweep(
+                                     self.directory + filename, processes))
+
+    def test_count_window_increases(self) -> None:
+        """Testing count_window_increases."""
+        measurements = data_input(self.directory + "test_data_1")
+        for k in range(1, len(measurements) + 2):
+            with self.subTest(k=k):
+                window_sums = [sum(measurements[i:i + k]) for i in
+                               range(len(measurements) - k + 1)]
+                expected_result = sum(
+                    window_sum_1 < window_sum_2 for window_sum_1, window_sum_2
+                    in zip(window_sums, window_sums[1:]))
+                self.assertEqual(expected_result,
+                                 count_window_increases(measurements, k))
+        with self.assertRaises(ValueError):
+            count_window_increases(measurements, 0)
+
+    def test_sonar_sweep_counter(self) -> None:
+        """Testing SonarSweepCounter."""
+        measurements = data_input(self.directory + "test_data_1")
+        counter = SonarSweepCounter()
+        for index, measurement in enumerate(measurements):
+            with self.subTest(index=index):
+                counter.add(measurement)
+                self.assertEqual(part_1(measurements[:index + 1]),
+                                 counter.increases)
+                self.assertEqual(part_2(measurements[:index + 1]),
+                                 counter.window_increases)
+
+    def test_sonar_sweep_counter_follow(self) -> None:
+        """Testing SonarSweepCounter.follow with lines appended in pieces."""
+        counter = SonarSweepCounter()
+        counter.follow(["199\n", "200\n", "2", "08\n", "1"])
+        self.assertEqual((2, 0), (counter.increases, counter.window_increases))
+        with self.assertRaises(ValueError):
+            counter.add(7)
+        counter.follow(["0", "\n", "9\n"])
+        self.assertEqual((2, 0), (counter.increases, counter.window_increases))
+        counter.follow(["210"])
+        counter.flush()
+        self.assertEqual((3, 1), (counter.increases, counter.window_increases))
+        self.assertEqual((10, 9, 210), counter.last_measurements)
+        counter.add("5")
+        counter.extend([7, 9])
+        self.assertEqual((5, 7, 9), counter.last_measurements)
+
 
 if __name__ == '__main__':
     unittest.main()
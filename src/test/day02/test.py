@@ -4,7 +4,8 @@ Tests for day 02.
 
 import unittest
 
-from src.main.day02.main import data_input, part_1, part_2
+from src.main.day02.main import data_input, data_stream, \
+    evaluate_commands, parallel_part_2, part_1, part_2
 
 
 class TestDay02(unittest.TestCase):
@@ -30,6 +31,30 @@ class TestDay02(unittest.TestCase):
                 commands = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(commands))
 
+    def test_parallel_part_2(self) -> None:
+        """Testing parallel_part_2."""
+        subtest_list: list[tuple[str, int, int]] = [("test_data_1", 1, 900),
+                                                    ("test_data_1", 4, 900),
+                                                    ("test_data_1", 10, 900),
+                                                    ("data", 4, 1176514794)]
+        for filename, processes, expected_result in subtest_list:
+            with self.subTest():
+                commands = data_input(self.directory + filename)
+                self.assertEqual(expected_result,
+                                 parallel_part_2(commands, processes))
+
+    def test_evaluate_commands(self) -> None:
+        """Testing evaluate_commands."""
+        subtest_list: list[tuple[str, tuple[int, int]]] = [
+            ("test_data_1", (150, 900)),
+            ("data", (1488669, 1176514794))
+        ]
+        for filename, expected_result in subtest_list:
+            with self.subTest():
+                self.assertEqual(
+                    expected_result,
+                    evaluate_commands(data_stream(self.directory + filename)))
+
 
 if __name__ == '__main__':
     unittest.main()
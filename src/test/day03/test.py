@@ -6,7 +6,8 @@ import unittest
 
 from src.main.day03.main import data_input, \
     determine_gamma_rate, determine_epsilon_rate, part_1, \
-    determine_oxygen_generator_rating, determine_co2_scrubber_rating, part_2
+    determine_oxygen_generator_rating, determine_co2_scrubber_rating, part_2, \
+    packed_data_input
 
 
 class TestDay03(unittest.TestCase):
@@ -53,6 +54,21 @@ class TestDay03(unittest.TestCase):
                 diagnostic_report = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(diagnostic_report))
 
+    def test_packed_diagnostic_report(self) -> None:
+        """Testing PackedDiagnosticReport."""
+        subtest_list: list[tuple[str, int, int]] = [
+            ("test_data_1", 198, 230),
+            ("data", 2261546, 6775520)
+        ]
+        for filename, expected_result_1, expected_result_2 in subtest_list:
+            with self.subTest():
+                report = packed_data_input(self.directory + filename)
+                self.assertEqual(expected_result_1,
+                                 report.gamma_rate() * report.epsilon_rate())
+                self.assertEqual(expected_result_2,
+                                 report.oxygen_generator_rating()
+                                 * report.co2_scrubber_rating())
+
 
 if __name__ == '__main__':
     unittest.main()
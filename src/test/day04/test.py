@@ -4,7 +4,8 @@ Tests for day 04.
 
 import unittest
 
-from src.main.day04.main import data_input, part_1, part_2
+from src.main.day04.main import Win, data_input, determine_wins, first_win, \
+    part_1, part_2, play_game, win_order
 
 
 class TestDay04(unittest.TestCase):
@@ -15,6 +16,9 @@ class TestDay04(unittest.TestCase):
     def test_part_1(self) -> None:
         """Testing part_1."""
         subtest_list: list[tuple[str, int]] = [("test_data_1", 4512),
+                                               ("test_data_2", 54),
+                                               ("test_data_3", 30),
+                                               ("test_data_4", 2350),
                                                ("data", 2496)]
         for filename, expected_result in subtest_list:
             with self.subTest():
@@ -24,12 +28,40 @@ class TestDay04(unittest.TestCase):
     def test_part_2(self) -> None:
         """Testing part_2."""
         subtest_list: list[tuple[str, int]] = [("test_data_1", 1924),
+                                               ("test_data_2", 54),
+                                               ("test_data_3", 76),
+                                               ("test_data_4", 65500),
                                                ("data", 25925)]
         for filename, expected_result in subtest_list:
             with self.subTest():
                 game = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(game))
 
+    def test_determine_wins(self) -> None:
+        """Testing determine_wins."""
+        game = data_input(self.directory + "test_data_1")
+        self.assertEqual(
+            [Win(0, 13, 2192), Win(1, 14, 1924), Win(2, 11, 4512)],
+            determine_wins(game))
+
+    def test_play_game(self) -> None:
+        """Testing play_game."""
+        for filename in ["test_data_1", "test_data_2", "test_data_3",
+                         "test_data_4", "data"]:
+            with self.subTest():
+                game = data_input(self.directory + filename)
+                expected_result = sorted(determine_wins(game), key=win_order)
+                wins = play_game(game)
+                self.assertEqual(expected_result, wins)
+                self.assertEqual([win.board_number for win in expected_result],
+                                 game.won_board_numbers)
+                self.assertEqual(
+                    part_1(data_input(self.directory + filename)),
+                    first_win(wins).score)
+                self.assertEqual(
+                    part_2(data_input(self.directory + filename)),
+                    wins[-1].score)
+
 
 if __name__ == '__main__':
     unittest.main()
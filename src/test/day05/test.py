@@ -4,7 +4,8 @@ Tests for day 05.
 
 import unittest
 
-from src.main.day05.main import data_input, part_1, part_2
+from src.main.day05.main import Plane, count_overlaps_by_sweep, \
+    count_overlaps_tiled, data_input, part_1, part_2
 
 
 class TestDay05(unittest.TestCase):
@@ -30,6 +31,61 @@ class TestDay05(unittest.TestCase):
                 game = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(game))
 
+    def test_plane(self) -> None:
+        """Testing Plane."""
+        subtest_list: list[tuple[str, int, int]] = [("test_data_1", 5, 12),
+                                                    ("data", 6548, 19663)]
+        for filename, expected_result_1, expected_result_2 in subtest_list:
+            with self.subTest():
+                instructions = data_input(self.directory + filename)
+                plane = Plane(int)
+                plane.mark(instructions)
+                self.assertEqual(
+                    expected_result_1,
+                    plane.amount_of_points_with_at_least_two_overlaps())
+                plane = Plane(int)
+                plane.mark(instructions, diagonally=True)
+                self.assertEqual(
+                    expected_result_2,
+                    plane.amount_of_points_with_at_least_two_overlaps())
+
+    def test_count_overlaps_by_sweep(self) -> None:
+        """Testing count_overlaps_by_sweep."""
+        subtest_list: list[tuple[str, int, int]] = [
+            ("test_data_1", 5, 12),
+            ("test_data_2", 500_000_001, 500_000_002),
+            ("data", 6548, 19663)
+        ]
+        for filename, expected_result_1, expected_result_2 in subtest_list:
+            with self.subTest():
+                instructions = data_input(self.directory + filename)
+                self.assertEqual(expected_result_1,
+                                 count_overlaps_by_sweep(instructions))
+                self.assertEqual(expected_result_2,
+                                 count_overlaps_by_sweep(instructions,
+                                                         diagonally=True))
+
+    def test_count_overlaps_tiled(self) -> None:
+        """Testing count_overlaps_tiled."""
+        subtest_list: list[tuple[str, int, int, int]] = [
+            ("test_data_1", 1, 5, 12),
+            ("test_data_1", 3, 5, 12),
+            ("test_data_1", 20, 5, 12),
+            ("data", 4, 6548, 19663)
+        ]
+        for filename, tiles_per_side, expected_result_1, expected_result_2 \
+                in subtest_list:
+            with self.subTest():
+                instructions = data_input(self.directory + filename)
+                self.assertEqual(expected_result_1,
+                                 count_overlaps_tiled(
+                                     instructions,
+                                     tiles_per_side=tiles_per_side))
+                self.assertEqual(expected_result_2,
+                                 count_overlaps_tiled(
+                                     instructions, diagonally=True,
+                                     tiles_per_side=tiles_per_side))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@ Tests for day 06.
 """
 
 import unittest
+from typing import Optional
 
 from src.main.day06.main import data_input, part_1, part_2, LanternfishSchool
 
@@ -86,6 +87,54 @@ class TestDay06(unittest.TestCase):
                 lanternfish_school = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(lanternfish_school))
 
+    def test_amount_of_lanternfish_by_matrix_power(self) -> None:
+        """Testing get_amount_of_lanternfish_by_matrix_power."""
+        subtest_list: list[tuple[str, int, Optional[int], int]] = [
+            ("test_data_1", 0, None, 5),
+            ("test_data_1", 18, None, 26),
+            ("test_data_1", 80, None, 5934),
+            ("test_data_1", 256, None, 26_984_457_539),
+            ("test_data_1", 256, 1_000_000_007, 984_457_357),
+            ("data", 256, None, 1_741_362_314_973)
+        ]
+        for filename, days, modulus, expected_result in subtest_list:
+            with self.subTest():
+                lanternfish_school = data_input(self.directory + filename)
+                self.assertEqual(expected_result,
+                                 lanternfish_school
+                                 .get_amount_of_lanternfish_by_matrix_power(
+                                     days, modulus))
+        lanternfish_school = data_input(self.directory + "test_data_1")
+        for days, modulus in [(-1, None), (18, 0), (18, -7)]:
+            with self.subTest(days=days, modulus=modulus):
+                with self.assertRaises(ValueError):
+                    lanternfish_school \
+                        .get_amount_of_lanternfish_by_matrix_power(days,
+                                                                   modulus)
+
+    def test_amounts_of_lanternfish(self) -> None:
+        """Testing get_amounts_of_lanternfish."""
+        lanternfish_school = data_input(self.directory + "test_data_1")
+        self.assertEqual([5, 5, 6, 7, 9, 10, 10, 10, 10, 11, 12, 15, 17, 19,
+                          20, 20, 21, 22, 26],
+                         lanternfish_school.get_amounts_of_lanternfish(
+                             range(19)))
+        self.assertEqual([26_984_457_539, 5934, 26],
+                         lanternfish_school.get_amounts_of_lanternfish(
+                             [256, 80, 18]))
+
+    def test_amount_of_lanternfish_shares_cache(self) -> None:
+        """Testing that get_amount_of_lanternfish reuses results across
+        schools."""
+        cached_function = \
+            LanternfishSchool._amount_of_lanternfish_for_one_fish
+        LanternfishSchool([3]).get_amount_of_lanternfish(100)
+        misses = cached_function.cache_info().misses
+        self.assertEqual(LanternfishSchool([3]).get_amount_of_lanternfish(100),
+                         LanternfishSchool([3, 3]).get_amount_of_lanternfish(
+                             100) // 2)
+        self.assertEqual(misses, cached_function.cache_info().misses)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,8 +3,10 @@ Tests for day 07.
 """
 
 import unittest
+from typing import Callable
 
-from src.main.day07.main import data_input, part_1, part_2
+from src.main.day07.main import data_input, determine_minimum_fuel, \
+    determine_total_fuels, part_1, part_2, sum_of_first_n_integers
 
 
 class TestDay07(unittest.TestCase):
@@ -34,6 +36,40 @@ class TestDay07(unittest.TestCase):
                 lanternfish_school = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(lanternfish_school))
 
+    def test_determine_minimum_fuel(self) -> None:
+        """Testing determine_minimum_fuel."""
+        subtest_list: list[tuple[str, Callable[[int], int], bool, int]] = [
+            ("test_data_1", lambda n: n, False, 37),
+            ("test_data_1", lambda n: n, True, 37),
+            ("test_data_1", sum_of_first_n_integers, False, 168),
+            ("test_data_1", sum_of_first_n_integers, True, 168),
+            ("test_data_1", lambda n: n ** 3, False, 2179),
+            ("test_data_1", lambda n: n ** 3, True, 2179),
+            ("data", lambda n: n, True, 325528),
+            ("data", sum_of_first_n_integers, True, 85015836)
+        ]
+        for filename, fuel_function, convex, expected_result in subtest_list:
+            with self.subTest():
+                crab_horizontal_positions = data_input(
+                    self.directory + filename)
+                self.assertEqual(expected_result,
+                                 determine_minimum_fuel(
+                                     crab_horizontal_positions,
+                                     fuel_function, convex))
+
+    def test_determine_total_fuels(self) -> None:
+        """Testing determine_total_fuels."""
+        crab_horizontal_positions = data_input(self.directory + "test_data_1")
+        total_fuels = determine_total_fuels(crab_horizontal_positions)
+        self.assertEqual(0, total_fuels.first_position)
+        self.assertEqual(17, len(total_fuels.linear))
+        self.assertEqual([41, 37, 39, 71], [total_fuels.linear[position] for
+                                            position in [1, 2, 3, 10]])
+        self.assertEqual([206, 168], [total_fuels.triangular[position] for
+                                      position in [2, 5]])
+        self.assertEqual(37, min(total_fuels.linear))
+        self.assertEqual(168, min(total_fuels.triangular))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,8 @@ Tests for day 08.
 
 import unittest
 
-from src.main.day08.main import data_input, part_1, part_2
+from src.main.day08.main import data_input, determine_output_value, \
+    determine_output_value_by_fingerprint, part_1, part_2
 
 
 class TestDay08(unittest.TestCase):
@@ -36,6 +37,17 @@ class TestDay08(unittest.TestCase):
                 lanternfish_school = data_input(self.directory + filename)
                 self.assertEqual(expected_result, part_2(lanternfish_school))
 
+    def test_determine_output_value(self) -> None:
+        """Testing determine_output_value and
+        determine_output_value_by_fingerprint."""
+        for filename in ["test_data_1", "test_data_2", "data"]:
+            data = data_input(self.directory + filename)
+            for entry in data:
+                with self.subTest():
+                    self.assertEqual(
+                        determine_output_value(entry),
+                        determine_output_value_by_fingerprint(entry))
+
 
 if __name__ == '__main__':
     unittest.main()